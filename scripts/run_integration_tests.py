@@ -82,6 +82,12 @@ Examples:
         help='Custom directory for test results (default: data/integration_test_results)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-run every batch in component tests instead of reusing identical runs'
+    )
+    
     parser.add_argument(
         '--timeout',
         type=int,
@@ -108,6 +114,9 @@ Examples:
         if args.output_dir:
             settings['data_dir'] = args.output_dir
         
+        if args.no_cache:
+            settings['cache_batch_runs'] = False
+        
         # Initialize test runner
         logger.info("Initializing integration test runner...")
         runner = IntegrationTestRunner(settings)
@@ -1,8 +1,15 @@
 # src/ai_analysis/analysis_aggregator.py
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
+from collections import Counter
 import json
+import os
 from pathlib import Path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .pattern_analyzer import PatternAnalyzer
 from .rule_suggester import RuleSuggester
@@ -10,6 +17,19 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Index file pointing at the most recently saved analysis
+LATEST_ANALYSIS_INDEX = "_latest.json"
+
+# Per rule type recommendations: (rule_type, recommendation type, description, priority)
+RULE_TYPE_RECOMMENDATIONS = [
+    ('company', 'company_rules', "Add {n} company name recognition rules", 'medium'),
+    ('specification', 'specification_rules', "Add {n} specification recognition rules", 'medium'),
+    ('material', 'material_rules', "Add {n} material recognition rules", 'low'),
+]
+
+# Buffer size for analysis writes, large enough to batch many small section writes
+WRITE_BUFFER_SIZE = 1 << 20
+
 class AnalysisAggregator:
     """Aggregates analysis results and generates insights"""
     
@@ -36,8 +56,9 @@ class AnalysisAggregator:
         ranked_suggestions = self.rule_suggester.rank_suggestions(filtered_suggestions)
         
         # Create comprehensive analysis
+        now = datetime.now()
         analysis = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'batch_summary': self._create_batch_summary(batch_results),
             'pattern_analysis': pattern_analysis,
             'rule_suggestions': [self._rule_suggestion_to_dict(s) for s in ranked_suggestions],
@@ -51,7 +72,7 @@ class AnalysisAggregator:
         }
         
         # Save analysis
-        self._save_analysis(analysis)
+        self._save_analysis(analysis, timestamp=now)
         
         self.logger.info(f"Analysis completed with {len(ranked_suggestions)} recommendations")
         return analysis
@@ -59,15 +80,9 @@ class AnalysisAggregator:
     def _create_batch_summary(self, results: List[Dict]) -> Dict:
         """Create summary of batch results"""
         total_items = len(results)
-        confidence_distribution = {'High': 0, 'Medium': 0, 'Low': 0}
-        success_count = 0
-        
-        for result in results:
-            confidence_level = result.get('confidence_level', 'Low')
-            confidence_distribution[confidence_level] += 1
-            
-            if result.get('success', False):
-                success_count += 1
+        levels = Counter(result.get('confidence_level', 'Low') for result in results)
+        success_count = sum(1 for result in results if result.get('success', False))
+        confidence_distribution = {level: levels.get(level, 0) for level in ('High', 'Medium', 'Low')}
         
         return {
             'total_items': total_items,
@@ -92,8 +107,9 @@ class AnalysisAggregator:
         }
         
         # Add composite score if it exists
-        if hasattr(suggestion, 'composite_score'):
-            result['composite_score'] = suggestion.composite_score
+        composite_score = getattr(suggestion, 'composite_score', None)
+        if composite_score is not None:
+            result['composite_score'] = composite_score
         
         return result
     
@@ -103,37 +119,39 @@ class AnalysisAggregator:
         
         # Pattern insights
         if pattern_analysis.get('missing_features'):
-            missing = pattern_analysis['missing_features']
-            most_missing = max(missing.items(), key=lambda x: x[1]) if missing else None
+            most_missing = Counter(pattern_analysis['missing_features']).most_common(1)
             if most_missing:
-                insights.append(f"Most missing feature: {most_missing[0]} ({most_missing[1]} items)")
+                feature, count = most_missing[0]
+                insights.append(f"Most missing feature: {feature} ({count} items)")
         
         # Rule suggestion insights
         if rule_suggestions:
-            high_confidence = [s for s in rule_suggestions if s.confidence > 0.8]
-            insights.append(f"Generated {len(rule_suggestions)} rule suggestions ({len(high_confidence)} high confidence)")
-            
-            # Rule type distribution
-            rule_types = {}
+            # Count high-confidence suggestions and rule types in one pass
+            high_confidence_count = 0
+            rule_types = Counter()
             for suggestion in rule_suggestions:
-                rule_types[suggestion.rule_type] = rule_types.get(suggestion.rule_type, 0) + 1
+                if suggestion.confidence > 0.8:
+                    high_confidence_count += 1
+                rule_types[suggestion.rule_type] += 1
+            
+            insights.append(f"Generated {len(rule_suggestions)} rule suggestions ({high_confidence_count} high confidence)")
             
-            most_common_type = max(rule_types.items(), key=lambda x: x[1]) if rule_types else None
+            # Rule type distribution
+            most_common_type = rule_types.most_common(1)
             if most_common_type:
-                insights.append(f"Most common suggestion type: {most_common_type[0]} ({most_common_type[1]} suggestions)")
+                rule_type, count = most_common_type[0]
+                insights.append(f"Most common suggestion type: {rule_type} ({count} suggestions)")
         
         # Context issues insights
         context_issues = pattern_analysis.get('context_issues', [])
         if context_issues:
-            issue_types = {}
-            for issue in context_issues:
-                issue_type = issue.get('type', 'unknown')
-                issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
+            issue_types = Counter(issue.get('type', 'unknown') for issue in context_issues)
             
             insights.append(f"Found {len(context_issues)} context interpretation issues")
-            if issue_types:
-                most_common_issue = max(issue_types.items(), key=lambda x: x[1])
-                insights.append(f"Most common issue: {most_common_issue[0]} ({most_common_issue[1]} occurrences)")
+            most_common_issue = issue_types.most_common(1)
+            if most_common_issue:
+                issue_type, count = most_common_issue[0]
+                insights.append(f"Most common issue: {issue_type} ({count} occurrences)")
         
         # Low confidence rate insight
         total_low_confidence = pattern_analysis.get('total_low_confidence', 0)
@@ -146,70 +164,105 @@ class AnalysisAggregator:
         """Generate actionable recommendations"""
         recommendations = []
         
+        # A suggestion can land in several buckets; convert each one only once
+        suggestion_dicts = {}
+        
+        def to_dict(suggestion) -> Dict:
+            key = id(suggestion)
+            if key not in suggestion_dicts:
+                suggestion_dicts[key] = self._rule_suggestion_to_dict(suggestion)
+            return suggestion_dicts[key]
+        
+        # Bucket suggestions in a single pass
+        high_priority, high_confidence_rules = [], []
+        type_buckets = {rule_type: [] for rule_type, _, _, _ in RULE_TYPE_RECOMMENDATIONS}
+        for suggestion in rule_suggestions:
+            if suggestion.priority >= 3:
+                high_priority.append(suggestion)
+            bucket = type_buckets.get(suggestion.rule_type)
+            if bucket is not None:
+                bucket.append(suggestion)
+            if suggestion.confidence > 0.8:
+                high_confidence_rules.append(suggestion)
+        
         # High priority recommendations
-        high_priority = [s for s in rule_suggestions if s.priority >= 3]
         if high_priority:
             recommendations.append({
                 'type': 'high_priority_rules',
                 'description': f"Consider implementing {len(high_priority)} high-priority rules",
                 'priority': 'high',
-                'rules': [self._rule_suggestion_to_dict(s) for s in high_priority[:3]]
-            })
-        
-        # Company name recommendations
-        company_rules = [s for s in rule_suggestions if s.rule_type == 'company']
-        if company_rules:
-            recommendations.append({
-                'type': 'company_rules',
-                'description': f"Add {len(company_rules)} company name recognition rules",
-                'priority': 'medium',
-                'rules': [self._rule_suggestion_to_dict(s) for s in company_rules[:3]]
-            })
-        
-        # Specification recommendations
-        spec_rules = [s for s in rule_suggestions if s.rule_type == 'specification']
-        if spec_rules:
-            recommendations.append({
-                'type': 'specification_rules',
-                'description': f"Add {len(spec_rules)} specification recognition rules",
-                'priority': 'medium',
-                'rules': [self._rule_suggestion_to_dict(s) for s in spec_rules[:3]]
+                'rules': [to_dict(s) for s in high_priority[:3]]
             })
         
-        # Material recommendations
-        material_rules = [s for s in rule_suggestions if s.rule_type == 'material']
-        if material_rules:
-            recommendations.append({
-                'type': 'material_rules',
-                'description': f"Add {len(material_rules)} material recognition rules",
-                'priority': 'low',
-                'rules': [self._rule_suggestion_to_dict(s) for s in material_rules[:3]]
-            })
+        # Rule type recommendations (company, specification, material)
+        for rule_type, rec_type, description, priority in RULE_TYPE_RECOMMENDATIONS:
+            rules = type_buckets[rule_type]
+            if rules:
+                recommendations.append({
+                    'type': rec_type,
+                    'description': description.format(n=len(rules)),
+                    'priority': priority,
+                    'rules': [to_dict(s) for s in rules[:3]]
+                })
         
         # High confidence recommendations
-        high_confidence_rules = [s for s in rule_suggestions if s.confidence > 0.8]
         if high_confidence_rules:
             recommendations.append({
                 'type': 'high_confidence_rules',
                 'description': f"Implement {len(high_confidence_rules)} high-confidence rules immediately",
                 'priority': 'high',
-                'rules': [self._rule_suggestion_to_dict(s) for s in high_confidence_rules[:5]]
+                'rules': [to_dict(s) for s in high_confidence_rules[:5]]
             })
         
         return recommendations
     
-    def _save_analysis(self, analysis: Dict):
-        """Save analysis to file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def _save_analysis(self, analysis: Dict, timestamp: Optional[datetime] = None):
+        """Save analysis to file, reusing the analysis timestamp when given"""
+        timestamp = (timestamp or datetime.now()).strftime("%Y%m%d_%H%M%S")
         analysis_file = self.analysis_dir / f"analysis_{timestamp}.json"
         
+        # Write to a temporary file and rename so readers never see a partial analysis
+        tmp_file = analysis_file.with_suffix('.json.tmp')
+        
         try:
-            with open(analysis_file, 'w') as f:
-                json.dump(analysis, f, indent=2, default=str)
+            with open(tmp_file, 'wb' if ORJSON_AVAILABLE else 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                if ORJSON_AVAILABLE:
+                    self._write_analysis_sections(analysis, f)
+                else:
+                    # json.dump already encodes incrementally into the file handle
+                    json.dump(analysis, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, analysis_file)
             
+            self._update_latest_index(analysis_file)
             self.logger.info(f"Analysis saved to {analysis_file}")
         except Exception as e:
             self.logger.error(f"Failed to save analysis: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+    
+    def _write_analysis_sections(self, analysis: Dict, f):
+        """Write analysis with orjson one top-level section at a time.
+        
+        Produces the same layout as an indented dump of the whole dict while
+        only holding one serialized section in memory.
+        """
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if not analysis:
+            f.write(b'{}')
+            return
+        
+        separator = b'{\n  '
+        for key, value in analysis.items():
+            f.write(separator)
+            f.write(orjson.dumps(str(key)))
+            f.write(b': ')
+            f.write(orjson.dumps(value, default=str, option=option).replace(b'\n', b'\n  '))
+            separator = b',\n  '
+        f.write(b'\n}')
     
     def load_previous_analysis(self, analysis_file: str = None) -> Dict:
         """Load a previous analysis from file"""
@@ -217,20 +270,53 @@ class AnalysisAggregator:
             analysis_path = self.analysis_dir / analysis_file
         else:
             # Get most recent analysis
-            analysis_files = list(self.analysis_dir.glob("analysis_*.json"))
-            if not analysis_files:
+            analysis_path = self._find_latest_analysis()
+            if analysis_path is None:
                 return {}
-            analysis_path = max(analysis_files, key=lambda x: x.stat().st_mtime)
         
         try:
-            with open(analysis_path, 'r') as f:
-                analysis = json.load(f)
+            with open(analysis_path, 'rb') as f:
+                data = f.read()
+            analysis = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             self.logger.info(f"Loaded analysis from {analysis_path}")
             return analysis
         except Exception as e:
             self.logger.error(f"Failed to load analysis: {e}")
             return {}
     
+    def _update_latest_index(self, analysis_file: Path):
+        """Atomically point the latest-analysis index at analysis_file"""
+        index_file = self.analysis_dir / LATEST_ANALYSIS_INDEX
+        tmp_file = index_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump({'latest': analysis_file.name}, f)
+        os.replace(tmp_file, index_file)
+    
+    def _find_latest_analysis(self) -> Optional[Path]:
+        """Locate the most recent analysis file, preferring the index over a directory scan"""
+        try:
+            with open(self.analysis_dir / LATEST_ANALYSIS_INDEX, 'r') as f:
+                latest = self.analysis_dir / json.load(f)['latest']
+            if latest.is_file():
+                return latest
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        # Index missing or stale, fall back to scanning the directory
+        latest_entry = None
+        latest_mtime = None
+        with os.scandir(self.analysis_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('analysis_') and entry.name.endswith('.json')):
+                    continue
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_entry, latest_mtime = entry, mtime
+        
+        return Path(latest_entry.path) if latest_entry is not None else None
+    
     def compare_analyses(self, current_analysis: Dict, previous_analysis: Dict) -> Dict:
         """Compare current analysis with previous analysis"""
         comparison = {
@@ -1,10 +1,14 @@
 # src/batch_processor/__init__.py
 from pathlib import Path
 from datetime import datetime
+import time
 from typing import Dict, List, Optional
 from dataclasses import asdict
 
-try:
+# Resolve the import path once from how this package was imported, rather than
+# attempting each layout in turn and unwinding ImportErrors
+if '.' in __name__:
+    # Imported as src.batch_processor
     from .batch_manager import BatchManager, BatchConfig, BatchStatus
     from .processor import BatchProcessor, ProcessingResult, BatchResult
     from ..progress_tracking.metrics_collector import MetricsCollector
@@ -13,30 +17,25 @@ try:
     from .dynamic_scaling_controller import DynamicScalingController
     from .scaling_manager import ScalingConfig
     from ..utils.logger import get_logger
-except ImportError:
-    # Fallback for when running as script
-    try:
-        from .batch_manager import BatchManager, BatchConfig, BatchStatus
-        from .processor import BatchProcessor, ProcessingResult, BatchResult
-        from progress_tracking.metrics_collector import MetricsCollector
-        from progress_tracking.performance_analyzer import PerformanceAnalyzer
-        from .feedback_loop import FeedbackLoopManager, FeedbackItem, FeedbackSummary, RefinementAction
-        from .dynamic_scaling_controller import DynamicScalingController
-        from .scaling_manager import ScalingConfig
-        from utils.logger import get_logger
-    except ImportError:
-        # Final fallback for pytest
-        from src.batch_processor.batch_manager import BatchManager, BatchConfig, BatchStatus
-        from src.batch_processor.processor import BatchProcessor, ProcessingResult, BatchResult
-        from src.progress_tracking.metrics_collector import MetricsCollector
-        from src.progress_tracking.performance_analyzer import PerformanceAnalyzer
-        from src.batch_processor.feedback_loop import FeedbackLoopManager, FeedbackItem, FeedbackSummary, RefinementAction
-        from src.batch_processor.dynamic_scaling_controller import DynamicScalingController
-        from src.batch_processor.scaling_manager import ScalingConfig
-        from src.utils.logger import get_logger
+else:
+    # Imported as a top-level package (src/ on sys.path); sibling packages
+    # only resolve through the src package, so load everything from there
+    from src.batch_processor.batch_manager import BatchManager, BatchConfig, BatchStatus
+    from src.batch_processor.processor import BatchProcessor, ProcessingResult, BatchResult
+    from src.progress_tracking.metrics_collector import MetricsCollector
+    from src.progress_tracking.performance_analyzer import PerformanceAnalyzer
+    from src.batch_processor.feedback_loop import FeedbackLoopManager, FeedbackItem, FeedbackSummary, RefinementAction
+    from src.batch_processor.dynamic_scaling_controller import DynamicScalingController
+    from src.batch_processor.scaling_manager import ScalingConfig
+    from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Target wall-clock seconds per batch, overridable via settings['batch_latency_slo']
+DEFAULT_BATCH_LATENCY_SLO = 60.0
+# Smoothing factor for the EWMA batch size recommendation
+BATCH_SIZE_EWMA_ALPHA = 0.5
+
 class BatchProcessingSystem:
     """Main interface for batch processing system"""
     
@@ -49,6 +48,10 @@ class BatchProcessingSystem:
         self.performance_analyzer = PerformanceAnalyzer(self.metrics_collector)
         self.settings = settings
         
+        # Latency-driven batch size recommendation, seeded from the first batch's config
+        self._ewma_batch_size: Optional[float] = None
+        self._slo_ns = int(float(settings.get('batch_latency_slo', DEFAULT_BATCH_LATENCY_SLO)) * 1e9)
+        
         # Initialize dynamic scaling if enabled
         if enable_dynamic_scaling:
             self.dynamic_scaling_controller = DynamicScalingController(
@@ -70,7 +73,9 @@ class BatchProcessingSystem:
         # Load batch data
         batch_data, batch_metadata = self.batch_manager.load_batch(batch_id)
         
-        # Initialize status
+        # Initialize status; datetimes are for the human-readable status only,
+        # latency is measured on the monotonic clock
+        batch_start_ns = time.perf_counter_ns()
         status = BatchStatus(
             batch_id=batch_id,
             status='processing',
@@ -90,6 +95,7 @@ class BatchProcessingSystem:
             # Process batch
             batch_result = self.batch_processor.process_batch(batch_data, config)
             batch_result.batch_id = batch_id  # Ensure correct batch ID
+            latency_ns = time.perf_counter_ns() - batch_start_ns
             
             # Update final status
             status.status = 'completed'
@@ -103,6 +109,8 @@ class BatchProcessingSystem:
             
             self.batch_manager.update_batch_status(batch_id, status)
             
+            self._update_batch_size_recommendation(config.batch_size, latency_ns)
+            
             # Update progress tracking - collect metrics from the batch result
             self.metrics_collector.collect_batch_metrics(batch_result)
             
@@ -111,11 +119,11 @@ class BatchProcessingSystem:
                 try:
                     scaling_applied = self.dynamic_scaling_controller.process_batch_completion(batch_result)
                     if scaling_applied:
-                        logger.info(f"Dynamic scaling applied after batch {batch_id}")
+                        logger.info("Dynamic scaling applied after batch %s", batch_id)
                 except Exception as e:
-                    logger.error(f"Error in dynamic scaling evaluation: {e}")
+                    logger.error("Error in dynamic scaling evaluation: %s", e)
             
-            logger.info(f"Batch {batch_id} completed successfully")
+            logger.info("Batch %s completed successfully", batch_id)
             return batch_result
             
         except Exception as e:
@@ -128,9 +136,31 @@ class BatchProcessingSystem:
             
             # Note: Failed batches are not collected as metrics since they don't produce BatchResult objects
             
-            logger.error(f"Batch {batch_id} failed: {e}")
+            logger.error("Batch %s failed: %s", batch_id, e)
             raise
     
+    def _update_batch_size_recommendation(self, batch_size: int, latency_ns: int):
+        """Update the EWMA batch size from a completed batch's latency against the SLO"""
+        current = self._ewma_batch_size if self._ewma_batch_size is not None else float(batch_size)
+        if latency_ns <= 0:
+            self._ewma_batch_size = current
+            return
+        
+        backpressure = latency_ns / self._slo_ns
+        if backpressure < 1:
+            # Under the SLO: move part of the way towards the size that would just meet it
+            target = current / backpressure
+            self._ewma_batch_size = BATCH_SIZE_EWMA_ALPHA * target + (1 - BATCH_SIZE_EWMA_ALPHA) * current
+        else:
+            # At or over the SLO: back off multiplicatively
+            self._ewma_batch_size = current / 2
+    
+    def get_recommended_batch_size(self) -> Optional[int]:
+        """Get the latency-driven batch size to use for the next BatchConfig, if any batch has run"""
+        if self._ewma_batch_size is None:
+            return None
+        return max(1, int(round(self._ewma_batch_size)))
+    
     def get_progress(self) -> Dict[str, any]:
         """Get overall progress"""
         return self.performance_analyzer.get_overall_progress()
@@ -150,7 +180,7 @@ class BatchProcessingSystem:
     def get_batch_results(self, batch_id: str) -> Optional[BatchResult]:
         """Get detailed results for a specific batch"""
         try:
-            batch_data, batch_metadata = self.batch_manager.load_batch(batch_id)
+            batch_metadata = self.batch_manager.get_batch_metadata(batch_id)
             status = self.batch_manager.get_batch_status(batch_id)
             
             if status and status.status == 'completed':
@@ -175,7 +205,7 @@ class BatchProcessingSystem:
             return None
             
         except Exception as e:
-            logger.error(f"Error getting batch results for {batch_id}: {e}")
+            logger.error("Error getting batch results for %s: %s", batch_id, e)
             return None
     
     # Dynamic Scaling Methods
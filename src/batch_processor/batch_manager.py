@@ -6,6 +6,9 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import uuid
+import atexit
+import threading
+from collections import OrderedDict
 
 try:
     from ..utils.logger import get_logger
@@ -17,6 +20,9 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Maximum number of batch metadata entries kept in memory
+METADATA_CACHE_SIZE = 256
+
 @dataclass
 class BatchConfig:
     """Configuration for batch processing"""
@@ -27,8 +33,9 @@ class BatchConfig:
     confidence_threshold_medium: float = 0.6
     save_intermediate_results: bool = True
     retry_failed_items: bool = True
+    n_jobs: Optional[int] = None  # Worker processes for item processing; None or 1 runs sequentially
 
-@dataclass
+@dataclass(slots=True)
 class BatchStatus:
     """Status tracking for a batch"""
     batch_id: str
@@ -43,6 +50,75 @@ class BatchStatus:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     error_message: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-ready dict, with times as ISO format strings"""
+        return {
+            'batch_id': self.batch_id,
+            'status': self.status,
+            'total_items': self.total_items,
+            'processed_items': self.processed_items,
+            'successful_items': self.successful_items,
+            'failed_items': self.failed_items,
+            'high_confidence_count': self.high_confidence_count,
+            'medium_confidence_count': self.medium_confidence_count,
+            'low_confidence_count': self.low_confidence_count,
+            'start_time': self.start_time.isoformat() if isinstance(self.start_time, datetime) else self.start_time,
+            'end_time': self.end_time.isoformat() if isinstance(self.end_time, datetime) else self.end_time,
+            'error_message': self.error_message
+        }
+
+class _StatusWriteBehind:
+    """Coalesces batch status writes per batch and flushes them from a background thread"""
+    
+    def __init__(self, write_fn, interval: float):
+        self._write = write_fn
+        self._interval = interval
+        self._pending: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="batch-status-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def put(self, batch_id: str, status_data: Dict):
+        """Queue a status write, replacing any not-yet-written status for the batch"""
+        with self._lock:
+            self._pending[batch_id] = status_data
+    
+    def get(self, batch_id: str) -> Optional[Dict]:
+        """Get the status queued for a batch but not yet on disk"""
+        with self._lock:
+            return self._pending.get(batch_id)
+    
+    def flush(self):
+        """Write all queued statuses to disk"""
+        with self._flush_lock:
+            with self._lock:
+                pending = list(self._pending.items())
+            
+            for batch_id, status_data in pending:
+                try:
+                    self._write(batch_id, status_data)
+                except OSError as e:
+                    logger.error(f"Failed to write status for batch {batch_id}: {e}")
+                
+                # Keep entries superseded during the write for the next flush
+                with self._lock:
+                    if self._pending.get(batch_id) is status_data:
+                        del self._pending[batch_id]
+    
+    def close(self):
+        """Stop the background thread and write anything still queued"""
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._thread.join()
+        self.flush()
+    
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self.flush()
 
 class BatchManager:
     """Manages batch creation, tracking, and state management"""
@@ -58,6 +134,17 @@ class BatchManager:
         
         # Dynamic batch size tracking
         self.dynamic_batch_size = None  # Will override config.batch_size if set
+        
+        # Batch metadata is written once at creation, so it is safe to cache
+        self._metadata_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        
+        # Optional write-behind for status updates: writes are coalesced per batch and
+        # flushed every status_write_behind_interval seconds instead of on each update
+        write_behind_interval = self.settings.get('status_write_behind_interval')
+        self._status_writer = (
+            _StatusWriteBehind(self._write_status_file, write_behind_interval)
+            if write_behind_interval else None
+        )
     
     def create_batch(self, config: BatchConfig) -> str:
         """Create a new batch from the dataset"""
@@ -120,6 +207,30 @@ class BatchManager:
         
         return batch_data, batch_metadata
 
+    def get_batch_metadata(self, batch_id: str) -> Dict:
+        """Load only the batch metadata, without reading the batch data file"""
+        cached = self._metadata_cache.get(batch_id)
+        if cached is not None:
+            self._metadata_cache.move_to_end(batch_id)
+            return cached
+        
+        batch_metadata_file = self.batches_dir / f"{batch_id}_metadata.json"
+        if not batch_metadata_file.exists():
+            raise FileNotFoundError(f"Batch {batch_id} not found")
+        
+        with open(batch_metadata_file, 'r') as f:
+            batch_metadata = json.load(f)
+        
+        self._cache_metadata(batch_id, batch_metadata)
+        return batch_metadata
+    
+    def _cache_metadata(self, batch_id: str, batch_metadata: Dict):
+        """Store metadata in the bounded LRU cache"""
+        self._metadata_cache[batch_id] = batch_metadata
+        self._metadata_cache.move_to_end(batch_id)
+        if len(self._metadata_cache) > METADATA_CACHE_SIZE:
+            self._metadata_cache.popitem(last=False)
+
     def load_batch_results(self, batch_id: str) -> Tuple[List[Dict], Dict]:
         """Load enhanced batch results instead of the original data for completed batches"""
         results_file = self.batches_dir / f"{batch_id}_results.json"
@@ -154,30 +265,49 @@ class BatchManager:
 
         status_file = self.batches_dir / f"{batch_id}_status.json"
         
-        # Convert datetime objects to ISO format strings for JSON serialization
-        status_data = asdict(status)
-        for time_field in ['start_time', 'end_time']:
-            if status_data.get(time_field) and isinstance(status_data[time_field], datetime):
-                status_data[time_field] = status_data[time_field].isoformat()
+        # Datetime fields are converted to ISO format strings for JSON serialization
+        status_data = status.to_dict()
         
         # ADD THIS LOGGING
         logger.info(f"Saving batch status for {batch_id} to {status_file}")
         logger.info(f"Status data: status={status.status}, processed={status.processed_items}/{status.total_items}")
         
-        with open(status_file, 'w') as f:
-            json.dump(asdict(status), f, indent=2, default=str)
+        if self._status_writer is not None:
+            self._status_writer.put(batch_id, status_data)
+        else:
+            self._write_status_file(batch_id, status_data)
         
         logger.info(f"Updated batch {batch_id} status: {status.status}")
     
+    def _write_status_file(self, batch_id: str, status_data: Dict):
+        """Write a serialized batch status to its status file"""
+        status_file = self.batches_dir / f"{batch_id}_status.json"
+        with open(status_file, 'w') as f:
+            json.dump(status_data, f, indent=2, default=str)
+    
+    def flush_status_updates(self):
+        """Write any status updates still held by the write-behind buffer"""
+        if self._status_writer is not None:
+            self._status_writer.flush()
+    
+    def close(self):
+        """Flush pending status updates and stop the write-behind thread"""
+        if self._status_writer is not None:
+            self._status_writer.close()
+    
     def get_batch_status(self, batch_id: str) -> Optional[BatchStatus]:
         """Get current batch status"""
-        status_file = self.batches_dir / f"{batch_id}_status.json"
-        
-        if not status_file.exists():
-            return None
-        
-        with open(status_file, 'r') as f:
-            status_data = json.load(f)
+        pending = self._status_writer.get(batch_id) if self._status_writer is not None else None
+        if pending is not None:
+            status_data = dict(pending)
+        else:
+            status_file = self.batches_dir / f"{batch_id}_status.json"
+            
+            if not status_file.exists():
+                return None
+            
+            with open(status_file, 'r') as f:
+                status_data = json.load(f)
         
         # Convert datetime strings back to datetime objects if they exist
         for time_field in ['start_time', 'end_time']:
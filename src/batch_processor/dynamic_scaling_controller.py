@@ -22,6 +22,9 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Relative change in batch characteristics below which a re-evaluation is skipped
+SIGNATURE_TOLERANCE = 0.05
+
 @dataclass
 class ScalingEvent:
     """Record of a scaling event"""
@@ -55,6 +58,11 @@ class DynamicScalingController:
         # Event tracking
         self.scaling_events: List[ScalingEvent] = []
         
+        # Signature of the batch that last led to a "no change" decision; batches
+        # that stay within SIGNATURE_TOLERANCE of it would get the same decision
+        self._last_decision: Optional[ScalingDecision] = None
+        self._steady_signature: Optional[Tuple[float, ...]] = None
+        
         logger.info("DynamicScalingController initialized with dynamic scaling enabled")
     
     def process_batch_completion(self, batch_result: BatchResult) -> bool:
@@ -64,11 +72,20 @@ class DynamicScalingController:
         
         logger.debug(f"Processing batch completion for scaling evaluation: {batch_result.batch_id}")
         
+        # Skip batches that look like the one behind the last "no change" decision
+        signature = self._batch_signature(batch_result)
+        if self._steady_signature is not None and self._signature_within_tolerance(signature, self._steady_signature):
+            logger.debug(f"Batch {batch_result.batch_id} unchanged since last scaling decision, skipping evaluation")
+            return False
+        
         self.batch_count_since_evaluation += 1
         
         # Check if it's time to evaluate scaling
         if self.batch_count_since_evaluation >= self.evaluation_frequency:
-            return self.evaluate_and_apply_scaling()
+            scaling_applied = self.evaluate_and_apply_scaling()
+            decided_no_change = self._last_decision is not None and not scaling_applied
+            self._steady_signature = signature if decided_no_change else None
+            return scaling_applied
         
         return False
     
@@ -76,6 +93,8 @@ class DynamicScalingController:
         """Evaluate current performance and apply scaling if needed"""
         logger.info("Evaluating dynamic scaling...")
         
+        self._last_decision = None
+        
         try:
             # Reset counter
             self.batch_count_since_evaluation = 0
@@ -111,6 +130,7 @@ class DynamicScalingController:
             
             # Record scaling event
             self._record_scaling_event(scaling_decision, current_performance, success)
+            self._last_decision = scaling_decision
             
             return success
             
@@ -196,6 +216,27 @@ class DynamicScalingController:
             'last_event': self.scaling_events[-1] if self.scaling_events else None
         }
     
+    @staticmethod
+    def _batch_signature(batch_result: BatchResult) -> Tuple[float, ...]:
+        """Summarize the batch characteristics that drive scaling decisions"""
+        distribution = batch_result.confidence_distribution or {}
+        return (
+            batch_result.total_items,
+            batch_result.successful_items,
+            distribution.get('High', 0),
+            distribution.get('Medium', 0),
+            distribution.get('Low', 0),
+            batch_result.processing_time
+        )
+    
+    @staticmethod
+    def _signature_within_tolerance(signature: Tuple[float, ...], reference: Tuple[float, ...]) -> bool:
+        """Check every component is within SIGNATURE_TOLERANCE of the reference"""
+        return all(
+            abs(value - ref) <= SIGNATURE_TOLERANCE * max(abs(ref), 1)
+            for value, ref in zip(signature, reference)
+        )
+    
     def _get_recent_batch_results(self, count: int = 5) -> List[Dict]:
         """Get recent batch results for analysis"""
         recent_metrics = self.metrics_collector.get_recent_metrics(count)
@@ -18,6 +18,12 @@ except ImportError:
     # Fallback for when running as script
     from batch_processor.batch_manager import BatchStatus, BatchConfig
 
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 @dataclass
@@ -63,60 +69,31 @@ class BatchProcessor:
         """Process a batch of products"""
         start_time = time.time()
         
-        results = []
+        self.logger.info(f"Starting batch processing with {len(batch_data)} items")
+        
+        total = len(batch_data)
+        n_jobs = config.n_jobs
+        if JOBLIB_AVAILABLE and n_jobs not in (None, 1) and total > 1:
+            # joblib groups short items per dispatch with its auto batch size
+            results = Parallel(n_jobs=n_jobs, batch_size='auto', prefer='processes')(
+                delayed(self._process_item)(i, product_data, total)
+                for i, product_data in enumerate(batch_data)
+            )
+        else:
+            results = [
+                self._process_item(i, product_data, total)
+                for i, product_data in enumerate(batch_data)
+            ]
+        
         successful_items = 0
         failed_items = 0
         confidence_distribution = {'High': 0, 'Medium': 0, 'Low': 0}
-        
-        self.logger.info(f"Starting batch processing with {len(batch_data)} items")
-        
-        for i, product_data in enumerate(batch_data):
-            item_start_time = time.time()
-            
-            try:
-                # Generate description
-                description_result = self.generator.generate_description(product_data)
-                
-                # Create processing result
-                processing_time = time.time() - item_start_time
-                
-                result = ProcessingResult(
-                    item_id=product_data.get('item_id', f'item_{i}'),
-                    original_description=description_result.original_description,
-                    enhanced_description=description_result.enhanced_description,
-                    confidence_score=description_result.confidence_score,
-                    confidence_level=description_result.confidence_level,
-                    extracted_features=description_result.extracted_features,
-                    processing_time=processing_time,
-                    success=True
-                )
-                
+        for result in results:
+            if result.success:
                 successful_items += 1
-                confidence_distribution[description_result.confidence_level] += 1
-                
-                self.logger.debug(f"Processed item {i+1}/{len(batch_data)}: {result.confidence_level}")
-                
-            except Exception as e:
-                processing_time = time.time() - item_start_time
-                
-                result = ProcessingResult(
-                    item_id=product_data.get('item_id', f'item_{i}'),
-                    original_description=product_data.get('item_description', ''),
-                    enhanced_description='',
-                    confidence_score=0.0,
-                    confidence_level='Low',
-                    extracted_features={},
-                    processing_time=processing_time,
-                    success=False,
-                    error_message=str(e)
-                )
-                
+            else:
                 failed_items += 1
-                confidence_distribution['Low'] += 1
-                
-                self.logger.error(f"Failed to process item {i+1}/{len(batch_data)}: {e}")
-            
-            results.append(result)
+            confidence_distribution[result.confidence_level] += 1
         
         total_processing_time = time.time() - start_time
         
@@ -137,6 +114,51 @@ class BatchProcessor:
         
         return batch_result
     
+    def _process_item(self, i: int, product_data: Dict, total: int) -> ProcessingResult:
+        """Process a single product, capturing any failure in the result"""
+        item_start_time = time.time()
+        
+        try:
+            # Generate description
+            description_result = self.generator.generate_description(product_data)
+            if description_result.confidence_level not in ('High', 'Medium', 'Low'):
+                raise ValueError(f"Unknown confidence level: {description_result.confidence_level}")
+            
+            # Create processing result
+            processing_time = time.time() - item_start_time
+            
+            result = ProcessingResult(
+                item_id=product_data.get('item_id', f'item_{i}'),
+                original_description=description_result.original_description,
+                enhanced_description=description_result.enhanced_description,
+                confidence_score=description_result.confidence_score,
+                confidence_level=description_result.confidence_level,
+                extracted_features=description_result.extracted_features,
+                processing_time=processing_time,
+                success=True
+            )
+            
+            self.logger.debug(f"Processed item {i+1}/{total}: {result.confidence_level}")
+            
+        except Exception as e:
+            processing_time = time.time() - item_start_time
+            
+            result = ProcessingResult(
+                item_id=product_data.get('item_id', f'item_{i}'),
+                original_description=product_data.get('item_description', ''),
+                enhanced_description='',
+                confidence_score=0.0,
+                confidence_level='Low',
+                extracted_features={},
+                processing_time=processing_time,
+                success=False,
+                error_message=str(e)
+            )
+            
+            self.logger.error(f"Failed to process item {i+1}/{total}: {e}")
+        
+        return result
+    
     def _create_summary(self, results: List[ProcessingResult], confidence_distribution: Dict[str, int]) -> Dict[str, any]:
         """Create summary statistics for the batch"""
         total_items = len(results)
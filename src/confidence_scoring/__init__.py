@@ -38,38 +38,53 @@ class ConfidenceScoringSystem:
         
         # Apply calibration if available
         if self.calibrator.is_calibrated:
-            calibrated_scores = self.calibrator.apply_calibration([confidence_score])
-            confidence_score = calibrated_scores[0]
+            confidence_score = self.calibrator.apply_scalar(confidence_score)
         
         # Categorize confidence level
         confidence_level = self.categorizer.categorize(confidence_score)
         
-        # Return enhanced result
-        enhanced_result = result.copy()
-        enhanced_result.update({
+        return self._build_scored_result(result, confidence_score, confidence_level.value, factors)
+    
+    def _build_scored_result(self, result: dict, confidence_score: float,
+                             confidence_level: str, factors: ConfidenceFactors) -> dict:
+        """Attach confidence score, level and factors to a result"""
+        # ConfidenceFactors holds exactly the five factor scores, so copy its fields directly
+        return {
+            **result,
             'confidence_score': confidence_score,
-            'confidence_level': confidence_level.value,
-            'confidence_factors': {
-                'feature_extraction_score': factors.feature_extraction_score,
-                'hts_context_score': factors.hts_context_score,
-                'pattern_match_score': factors.pattern_match_score,
-                'completeness_score': factors.completeness_score,
-                'consistency_score': factors.consistency_score
-            }
-        })
-        
-        return enhanced_result
+            'confidence_level': confidence_level,
+            'confidence_factors': vars(factors).copy()
+        }
     
-    def process_batch(self, results: list) -> dict:
-        """Process a batch of results and return statistics"""
-        scored_results = []
+    def process_batch(self, results: list, return_results: bool = True) -> dict:
+        """Process a batch of results and return statistics
+        
+        With return_results=False only the statistics are computed and 'results' is None,
+        so no per-item result dicts or confidence factors are kept alive.
+        """
+        # Score every item first so calibration and categorization run once per batch
+        if return_results:
+            scored = [self.scorer.calculate_confidence(result) for result in results]
+            confidence_scores = [confidence_score for confidence_score, _ in scored]
+        else:
+            confidence_scores = [self.scorer.calculate_confidence(result)[0] for result in results]
+        
+        if confidence_scores and self.calibrator.is_calibrated:
+            confidence_scores = self.calibrator.apply_calibration(confidence_scores)
+        
+        level_codes = self.categorizer.categorize_codes(confidence_scores)
         
-        for result in results:
-            scored_result = self.score_and_categorize(result)
-            scored_results.append(scored_result)
+        scored_results = None
+        if return_results:
+            confidence_levels = self.categorizer.labels_for_codes(level_codes).tolist()
+            scored_results = [
+                self._build_scored_result(result, confidence_score, confidence_level, factors)
+                for result, confidence_score, confidence_level, (_, factors)
+                in zip(results, confidence_scores, confidence_levels, scored)
+            ]
         
-        # Get categorization statistics
-        stats = self.categorizer.get_categorization_stats(scored_results)
+        # Get categorization statistics from the level codes rather than the result dicts
+        stats = self.categorizer.get_score_stats(confidence_scores, level_codes)
         
         return {
             'results': scored_results,
@@ -1,14 +1,49 @@
 # src/confidence_scoring/calibrator.py
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Tuple, Union
+import importlib.util
 import numpy as np
 
-try:
-    from sklearn.isotonic import IsotonicRegression
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
+# sklearn is only imported when a large calibration set needs it
+SKLEARN_AVAILABLE = importlib.util.find_spec("sklearn") is not None
+if not SKLEARN_AVAILABLE:
     print("Warning: sklearn not available. Calibration will use simple linear scaling.")
 
+# Calibration sets at least this large are fitted with sklearn's IsotonicRegression;
+# smaller ones use the pure NumPy pool-adjacent-violators fit below
+SKLEARN_ISOTONIC_MIN_SAMPLES = 5000
+
+
+def _pava_fit(scores: np.ndarray, quality: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Fit a non-decreasing isotonic regression with pool-adjacent-violators.
+    
+    Returns the sorted unique scores and their fitted values, suitable for np.interp.
+    Duplicate scores are first merged into their mean, as IsotonicRegression does.
+    """
+    order = np.argsort(scores, kind='mergesort')
+    scores = scores[order]
+    quality = quality[order]
+    
+    unique_scores, starts, counts = np.unique(scores, return_index=True, return_counts=True)
+    means = np.add.reduceat(quality, starts) / counts
+    
+    # Stack of pooled blocks as (mean, weight, length)
+    block_means: List[float] = []
+    block_weights: List[float] = []
+    block_lengths: List[int] = []
+    for mean, weight in zip(means.tolist(), counts.tolist()):
+        length = 1
+        while block_means and block_means[-1] > mean:
+            prev_mean = block_means.pop()
+            prev_weight = block_weights.pop()
+            mean = (prev_mean * prev_weight + mean * weight) / (prev_weight + weight)
+            weight += prev_weight
+            length += block_lengths.pop()
+        block_means.append(mean)
+        block_weights.append(weight)
+        block_lengths.append(length)
+    
+    return unique_scores, np.repeat(np.asarray(block_means, dtype=np.float64), block_lengths)
+
 class ConfidenceCalibrator:
     """Calibrates confidence scores based on historical performance"""
     
@@ -16,6 +51,9 @@ class ConfidenceCalibrator:
         self.calibration_model = None
         self.is_calibrated = False
         self.linear_params = None
+        # Isotonic fit as sorted breakpoints, applied with np.interp instead of predict()
+        self._iso_x = None
+        self._iso_y = None
     
     def calibrate_scores(self, confidence_scores: List[float], 
                         actual_quality: List[bool]) -> List[float]:
@@ -25,51 +63,111 @@ class ConfidenceCalibrator:
         
         if SKLEARN_AVAILABLE:
             # Use isotonic regression
-            self.calibration_model = IsotonicRegression(out_of_bounds='clip')
-            self.calibration_model.fit(confidence_scores, actual_quality)
-            calibrated_scores = self.calibration_model.predict(confidence_scores)
+            self.linear_params = None
+            if len(confidence_scores) >= SKLEARN_ISOTONIC_MIN_SAMPLES:
+                from sklearn.isotonic import IsotonicRegression
+                self.calibration_model = IsotonicRegression(out_of_bounds='clip')
+                self.calibration_model.fit(confidence_scores, actual_quality)
+                self._iso_x = np.asarray(self.calibration_model.X_thresholds_, dtype=np.float64)
+                self._iso_y = np.asarray(self.calibration_model.y_thresholds_, dtype=np.float64)
+            else:
+                self.calibration_model = None
+                self._iso_x, self._iso_y = _pava_fit(
+                    np.asarray(confidence_scores, dtype=np.float64),
+                    np.asarray(actual_quality, dtype=np.float64)
+                )
+            calibrated_scores = np.interp(confidence_scores, self._iso_x, self._iso_y)
         else:
             # Use simple linear calibration
+            self.calibration_model = None
+            self._iso_x = self._iso_y = None
             self._fit_linear_calibration(confidence_scores, actual_quality)
             calibrated_scores = self._apply_linear_calibration(confidence_scores)
         
         self.is_calibrated = True
+        # Bind the fitted model's apply function so later calls skip the state checks
+        self.apply_calibration = (
+            self._apply_iso_interp if self._iso_x is not None else self._apply_linear
+        )
         return calibrated_scores.tolist() if hasattr(calibrated_scores, 'tolist') else calibrated_scores
     
     def apply_calibration(self, confidence_scores: List[float]) -> List[float]:
-        """Apply trained calibration to new scores"""
+        """Apply trained calibration to new scores
+        
+        Replaced on the instance by the fitted model's apply function once calibrate_scores
+        has run; this checked version covers the uncalibrated state.
+        """
         if not self.is_calibrated:
             return confidence_scores
         
-        if SKLEARN_AVAILABLE and self.calibration_model is not None:
-            return self.calibration_model.predict(confidence_scores).tolist()
+        if self._iso_x is not None:
+            # np.interp clamps outside the fitted range, matching out_of_bounds='clip'
+            return np.interp(confidence_scores, self._iso_x, self._iso_y).tolist()
         elif self.linear_params is not None:
-            return self._apply_linear_calibration(confidence_scores)
+            return self._apply_linear_calibration(confidence_scores).tolist()
         else:
             return confidence_scores
     
+    def apply_scalar(self, confidence_score: float) -> float:
+        """Apply trained calibration to a single score without building arrays"""
+        if self._iso_x is not None:
+            x, y = self._iso_x, self._iso_y
+            if confidence_score <= x[0]:
+                return float(y[0])
+            if confidence_score >= x[-1]:
+                return float(y[-1])
+            # Same slope form as np.interp, so results match apply_calibration exactly
+            i = int(np.searchsorted(x, confidence_score, side='right')) - 1
+            slope = (y[i + 1] - y[i]) / (x[i + 1] - x[i])
+            return float(slope * (confidence_score - x[i]) + y[i])
+        elif self.is_calibrated and self.linear_params is not None:
+            a, b = self.linear_params
+            return min(max(confidence_score * a + b, 0.0), 1.0)
+        else:
+            return confidence_score
+    
+    def _apply_iso_interp(self, confidence_scores: List[float]) -> List[float]:
+        """Apply the isotonic fit by interpolating between its breakpoints"""
+        return np.interp(confidence_scores, self._iso_x, self._iso_y).tolist()
+    
+    def _apply_linear(self, confidence_scores: List[float]) -> List[float]:
+        """Apply the linear fit"""
+        return self._apply_linear_calibration(confidence_scores).tolist()
+    
     def _fit_linear_calibration(self, confidence_scores: List[float], 
                                actual_quality: List[bool]):
         """Fit simple linear calibration parameters"""
         # Convert to numpy arrays
-        scores = np.array(confidence_scores)
-        quality = np.array(actual_quality, dtype=float)
+        scores = np.asarray(confidence_scores, dtype=np.float64)
+        quality = np.asarray(actual_quality, dtype=np.float64)
+        n = scores.size
         
-        # Simple linear regression: y = ax + b
-        if len(scores) > 1:
-            a = np.corrcoef(scores, quality)[0, 1] * np.std(quality) / np.std(scores)
-            b = np.mean(quality) - a * np.mean(scores)
-            self.linear_params = (a, b)
+        # Simple linear regression: y = ax + b, with slope cov(x, y) / var(x) from centered dots
+        if n > 1:
+            mean_x = scores.mean()
+            mean_y = quality.mean()
+            dx = scores - mean_x
+            dy = quality - mean_y
+            var_x = dx @ dx
+            if var_x == 0:
+                # All scores identical, no slope to fit
+                self.linear_params = (1.0, 0.0)
+                return
+            a = (dx @ dy) / var_x
+            b = mean_y - a * mean_x
+            self.linear_params = (float(a), float(b))
         else:
             self.linear_params = (1.0, 0.0)
     
-    def _apply_linear_calibration(self, confidence_scores: List[float]) -> List[float]:
-        """Apply linear calibration"""
+    def _apply_linear_calibration(self, confidence_scores: Union[List[float], np.ndarray]) -> np.ndarray:
+        """Apply linear calibration, returning a clipped float64 array"""
+        scores = np.asarray(confidence_scores, dtype=np.float64)
         if self.linear_params is None:
-            return confidence_scores
+            return scores
         
         a, b = self.linear_params
-        calibrated = [max(0.0, min(1.0, a * score + b)) for score in confidence_scores]
+        calibrated = scores * a + b
+        np.clip(calibrated, 0.0, 1.0, out=calibrated)
         return calibrated
     
     def get_calibration_quality(self) -> Dict:
@@ -77,7 +175,7 @@ class ConfidenceCalibrator:
         if not self.is_calibrated:
             return {"is_calibrated": False}
         
-        if SKLEARN_AVAILABLE and self.calibration_model is not None:
+        if self._iso_x is not None:
             return {
                 "is_calibrated": True,
                 "model_type": "IsotonicRegression",
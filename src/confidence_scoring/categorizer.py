@@ -2,6 +2,7 @@
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
 
 class ConfidenceLevel(Enum):
     HIGH = "High"
@@ -20,6 +21,13 @@ class ConfidenceCategorizer:
     
     def __init__(self, thresholds: ConfidenceThresholds = None):
         self.thresholds = thresholds or ConfidenceThresholds()
+        # Precompiled boundaries and labels for vectorized categorization
+        self._bounds = np.array(
+            [self.thresholds.medium_threshold, self.thresholds.high_threshold], dtype=np.float64
+        )
+        self._labels = np.array(
+            [ConfidenceLevel.LOW.value, ConfidenceLevel.MEDIUM.value, ConfidenceLevel.HIGH.value]
+        )
     
     def categorize(self, confidence_score: float) -> ConfidenceLevel:
         """Categorize confidence score into level"""
@@ -30,6 +38,33 @@ class ConfidenceCategorizer:
         else:
             return ConfidenceLevel.LOW
     
+    def categorize_codes(self, confidence_scores) -> np.ndarray:
+        """Categorize many scores at once, returning level codes (0=Low, 1=Medium, 2=High)"""
+        return np.digitize(np.asarray(confidence_scores, dtype=np.float64), self._bounds)
+    
+    def categorize_many(self, confidence_scores) -> np.ndarray:
+        """Categorize many scores at once, returning an array of level values"""
+        return self.labels_for_codes(self.categorize_codes(confidence_scores))
+    
+    def labels_for_codes(self, codes: np.ndarray) -> np.ndarray:
+        """Map level codes from categorize_codes to level values"""
+        return self._labels[codes]
+    
+    def get_score_stats(self, confidence_scores, codes: np.ndarray = None) -> Dict:
+        """Get categorization statistics straight from scores, without per-result dicts"""
+        scores = np.asarray(confidence_scores, dtype=np.float64)
+        if codes is None:
+            codes = self.categorize_codes(scores)
+        low, medium, high = np.bincount(codes, minlength=len(self._labels)).tolist()
+        total = int(scores.size)
+        
+        return {
+            'distribution': {'High': high, 'Medium': medium, 'Low': low},
+            'total_items': total,
+            'avg_score': float(scores.mean()) if total else 0.0,
+            'high_confidence_rate': high / total if total else 0.0
+        }
+    
     def get_categorization_stats(self, results: List[Dict]) -> Dict:
         """Get statistics on confidence categorization"""
         levels = {'High': 0, 'Medium': 0, 'Low': 0}
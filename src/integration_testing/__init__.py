@@ -6,7 +6,7 @@ This module provides comprehensive integration testing capabilities for all syst
 working together, ensuring the entire iterative improvement system functions correctly as a cohesive unit.
 """
 
-from .system_tester import SystemIntegrationTester, TestResult, IntegrationTest
+from .system_tester import SystemIntegrationTester, TestResult, TestStatus, IntegrationTest
 from .component_tester import ComponentInteractionTester
 from .performance_tester import PerformanceIntegrationTester
 from .test_runner import IntegrationTestRunner
@@ -19,6 +19,7 @@ __all__ = [
     'IntegrationTestRunner',
     'TestDataGenerator',
     'TestResult',
+    'TestStatus',
     'IntegrationTest'
 ]
 
@@ -3,8 +3,76 @@ from typing import List, Dict, Any, Optional
 from unittest.mock import Mock, MagicMock
 import pandas as pd
 from datetime import datetime
+from types import MappingProxyType
 import uuid
 
+try:
+    from ai_analysis import RuleSuggestion, AINote
+    from utils.smart_description_generator import DescriptionResult
+except ImportError:
+    # Fallback for different import contexts
+    from src.ai_analysis import RuleSuggestion, AINote
+    from src.utils.smart_description_generator import DescriptionResult
+
+# Sample products shared by every generator; read-only so one test cannot alter another's data
+_SAMPLE_PRODUCTS = (
+    MappingProxyType({
+        'item_id': 'test_001',
+        'item_description': '36 C153 MJ 22 TN431 ZINC',
+        'final_hts': '7307.19.30.70',
+        'material_detail': 'ductile iron'
+    }),
+    MappingProxyType({
+        'item_id': 'test_002',
+        'item_description': 'SMITH BLAIR 170008030 SPACER, 18" ; DI ;',
+        'final_hts': '7307.19.30.70',
+        'material_detail': 'ductile iron'
+    }),
+    MappingProxyType({
+        'item_id': 'test_003',
+        'item_description': 'MUELLER H16008 CORPORATION FITTING',
+        'final_hts': '7307.19.30.70',
+        'material_detail': 'cast iron'
+    }),
+    MappingProxyType({
+        'item_id': 'test_004',
+        'item_description': 'PVC PIPE 6 INCH DIAMETER',
+        'final_hts': '3917.23.00.00',
+        'material_detail': 'pvc'
+    }),
+    MappingProxyType({
+        'item_id': 'test_005',
+        'item_description': 'COPPER TUBE 1/2 INCH',
+        'final_hts': '7411.10.10.00',
+        'material_detail': 'copper'
+    })
+)
+
+# HTS reference data returned by the mock data loader
+_MOCK_HTS_DATA = MappingProxyType({
+    '7307.19.30.70': MappingProxyType({
+        'description': 'Tube or pipe fittings of iron or steel',
+        'chapter': '73',
+        'heading': '7307',
+        'subheading': '7307.19',
+        'tariff_line': '7307.19.30.70'
+    }),
+    '3917.23.00.00': MappingProxyType({
+        'description': 'Tubes, pipes and hoses of plastics',
+        'chapter': '39',
+        'heading': '3917',
+        'subheading': '3917.23',
+        'tariff_line': '3917.23.00.00'
+    }),
+    '7411.10.10.00': MappingProxyType({
+        'description': 'Copper tubes and pipes',
+        'chapter': '74',
+        'heading': '7411',
+        'subheading': '7411.10',
+        'tariff_line': '7411.10.10.00'
+    })
+})
+
 class TestDataGenerator:
     """
     Test data generator for integration testing
@@ -13,86 +81,37 @@ class TestDataGenerator:
     """
     
     def __init__(self):
-        self.sample_products = [
-            {
-                'item_id': 'test_001',
-                'item_description': '36 C153 MJ 22 TN431 ZINC',
-                'final_hts': '7307.19.30.70',
-                'material_detail': 'ductile iron'
-            },
-            {
-                'item_id': 'test_002', 
-                'item_description': 'SMITH BLAIR 170008030 SPACER, 18" ; DI ;',
-                'final_hts': '7307.19.30.70',
-                'material_detail': 'ductile iron'
-            },
-            {
-                'item_id': 'test_003',
-                'item_description': 'MUELLER H16008 CORPORATION FITTING',
-                'final_hts': '7307.19.30.70',
-                'material_detail': 'cast iron'
-            },
-            {
-                'item_id': 'test_004',
-                'item_description': 'PVC PIPE 6 INCH DIAMETER',
-                'final_hts': '3917.23.00.00',
-                'material_detail': 'pvc'
-            },
-            {
-                'item_id': 'test_005',
-                'item_description': 'COPPER TUBE 1/2 INCH',
-                'final_hts': '7411.10.10.00',
-                'material_detail': 'copper'
-            }
-        ]
+        # Shared across generators; the mappings are read-only
+        self.sample_products = _SAMPLE_PRODUCTS
+        self._sample_products_df: Optional[pd.DataFrame] = None
+    
+    def _sample_products_frame(self) -> pd.DataFrame:
+        """Get a copy of the sample products DataFrame, which is built only once"""
+        if self._sample_products_df is None:
+            self._sample_products_df = pd.DataFrame(self.sample_products)
+        return self._sample_products_df.copy()
     
     def create_mock_data_loader(self) -> Mock:
         """Create a mock data loader for testing"""
         mock_loader = Mock()
         
         # Mock product data loading
-        mock_loader.load_product_data.return_value = pd.DataFrame(self.sample_products)
+        mock_loader.load_product_data.return_value = self._sample_products_frame()
         mock_loader.load_test_data.return_value = self.sample_products
         
         # Mock HTS reference data
-        mock_hts_data = {
-            '7307.19.30.70': {
-                'description': 'Tube or pipe fittings of iron or steel',
-                'chapter': '73',
-                'heading': '7307',
-                'subheading': '7307.19',
-                'tariff_line': '7307.19.30.70'
-            },
-            '3917.23.00.00': {
-                'description': 'Tubes, pipes and hoses of plastics',
-                'chapter': '39',
-                'heading': '3917',
-                'subheading': '3917.23',
-                'tariff_line': '3917.23.00.00'
-            },
-            '7411.10.10.00': {
-                'description': 'Copper tubes and pipes',
-                'chapter': '74',
-                'heading': '7411',
-                'subheading': '7411.10',
-                'tariff_line': '7411.10.10.00'
-            }
-        }
-        mock_loader.load_hts_reference.return_value = mock_hts_data
+        mock_loader.load_hts_reference.return_value = _MOCK_HTS_DATA
         
         return mock_loader
     
     def create_mock_description_generator(self) -> Mock:
         """Create a mock description generator for testing"""
         mock_generator = Mock()
+        # One timestamp for every description this mock generates
+        generated_at = datetime.now().isoformat()
         
         # Mock description generation results
         def mock_generate_description(product_data):
-            try:
-                from utils.smart_description_generator import DescriptionResult
-            except ImportError:
-                from src.utils.smart_description_generator import DescriptionResult
-            
             # Create varied results for testing with improved confidence distribution
             item_id = product_data.get('item_id', 'unknown')
             confidence_scores = {
@@ -125,7 +144,7 @@ class TestDataGenerator:
                 processing_metadata={
                     'processing_time': 0.1,
                     'rules_applied': ['basic_material_detection', 'hts_validation'],
-                    'generated_at': datetime.now().isoformat()
+                    'generated_at': generated_at
                 }
             )
         
@@ -162,10 +181,6 @@ class TestDataGenerator:
         
         # Mock rule suggestion generation
         def mock_generate_suggestions(analysis):
-            try:
-                from ai_analysis import RuleSuggestion
-            except ImportError:
-                from src.ai_analysis import RuleSuggestion
             return [
                 RuleSuggestion(
                     rule_id="material_detection_001",
@@ -187,18 +202,19 @@ class TestDataGenerator:
     def create_mock_processing_results(self) -> List[Dict[str, Any]]:
         """Create mock processing results for testing"""
         results = []
+        generated_at = datetime.now().isoformat()
+        
+        # Simulate processing result with improved confidence distribution
+        # Target: ~80% High confidence, ~15% Medium, ~5% Low for better performance scores
+        confidence_scores = {
+            'test_001': 0.95,  # High confidence
+            'test_002': 0.88,  # High confidence (improved from Medium)
+            'test_003': 0.74,  # Medium confidence (improved from Low)
+            'test_004': 0.92,  # High confidence
+            'test_005': 0.86   # High confidence (improved from Low)
+        }
         
         for product in self.sample_products:
-            # Simulate processing result with improved confidence distribution
-            # Target: ~80% High confidence, ~15% Medium, ~5% Low for better performance scores
-            confidence_scores = {
-                'test_001': 0.95,  # High confidence
-                'test_002': 0.88,  # High confidence (improved from Medium)
-                'test_003': 0.74,  # Medium confidence (improved from Low)
-                'test_004': 0.92,  # High confidence
-                'test_005': 0.86   # High confidence (improved from Low)
-            }
-            
             confidence = confidence_scores.get(product['item_id'], 0.85)  # Default to high confidence
             
             result = {
@@ -215,7 +231,7 @@ class TestDataGenerator:
                 'processing_metadata': {
                     'processing_time': 0.1,
                     'rules_applied': ['material_detection', 'hts_validation'],
-                    'generated_at': datetime.now().isoformat()
+                    'generated_at': generated_at
                 }
             }
             
@@ -314,10 +330,11 @@ class TestDataGenerator:
     
     def create_mock_metrics_data(self) -> List[Dict[str, Any]]:
         """Create mock metrics data for testing"""
+        timestamp = datetime.now().isoformat()
         return [
             {
                 'batch_id': 'test_batch_001',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'success_rate': 0.92,  # Improved success rate
                 'avg_confidence': 0.85,  # Improved average confidence
                 'processing_time': 45.2,
@@ -329,7 +346,7 @@ class TestDataGenerator:
             },
             {
                 'batch_id': 'test_batch_002',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'success_rate': 0.88,  # Improved success rate
                 'avg_confidence': 0.82,  # Improved average confidence
                 'processing_time': 52.1,
@@ -343,15 +360,11 @@ class TestDataGenerator:
     
     def create_test_ai_notes(self) -> List[Dict[str, Any]]:
         """Create test AI notes for testing"""
-        try:
-            from ai_analysis import AINote
-        except ImportError:
-            from src.ai_analysis import AINote
-        
+        now = datetime.now()
         return [
             AINote(
                 note_id=f"note_{uuid.uuid4()}",
-                timestamp=datetime.now(),
+                timestamp=now,
                 note_type="pattern_analysis",
                 content="Identified pattern: Material names are inconsistently formatted across entries",
                 context={
@@ -366,7 +379,7 @@ class TestDataGenerator:
             ),
             AINote(
                 note_id=f"note_{uuid.uuid4()}",
-                timestamp=datetime.now(),
+                timestamp=now,
                 note_type="improvement_suggestion",
                 content="Recommend adding material standardization rules to improve consistency",
                 context={
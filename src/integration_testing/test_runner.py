@@ -1,10 +1,11 @@
 # src/integration_testing/test_runner.py
 import time
 import argparse
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
-from .system_tester import SystemIntegrationTester
+from .system_tester import SystemIntegrationTester, TestResult, TestStatus
 from .component_tester import ComponentInteractionTester 
 from .performance_tester import PerformanceIntegrationTester
 try:
@@ -216,9 +217,10 @@ class IntegrationTestRunner:
             return
         
         total = len(results)
-        passed = len([r for r in results.values() if r.status == "passed"])
-        failed = len([r for r in results.values() if r.status == "failed"])
-        skipped = len([r for r in results.values() if r.status == "skipped"])
+        status_counts = Counter(r.status for r in results.values())
+        passed = status_counts[TestStatus.PASSED]
+        failed = status_counts[TestStatus.FAILED]
+        skipped = status_counts[TestStatus.SKIPPED]
         
         self.logger.info(f"\n{test_type} Results:")
         self.logger.info(f"  Total Tests: {total}")
@@ -282,9 +284,10 @@ class IntegrationTestRunner:
             if "error" not in component_results:
                 summary["tests_run"].append("component_interaction")
                 total_component_tests = len(component_results)
-                passed_component_tests = len([r for r in component_results.values() if r.status == "passed"])
-                failed_component_tests = len([r for r in component_results.values() if r.status == "failed"])
-                skipped_component_tests = len([r for r in component_results.values() if r.status == "skipped"])
+                status_counts = Counter(r.status for r in component_results.values())
+                passed_component_tests = status_counts[TestStatus.PASSED]
+                failed_component_tests = status_counts[TestStatus.FAILED]
+                skipped_component_tests = status_counts[TestStatus.SKIPPED]
                 
                 summary["total_test_count"] += total_component_tests
                 summary["total_passed"] += passed_component_tests
@@ -359,7 +362,9 @@ class IntegrationTestRunner:
             
             # Convert results to serializable format
             def serialize_result(obj):
-                if hasattr(obj, '__dict__'):
+                if isinstance(obj, TestResult):
+                    return obj.to_dict()
+                elif hasattr(obj, '__dict__'):
                     return obj.__dict__
                 elif hasattr(obj, '_asdict'):
                     return obj._asdict()
@@ -385,6 +390,8 @@ def main():
     parser.add_argument('--no-component', action='store_true', help='Skip component interaction tests')
     parser.add_argument('--no-performance', action='store_true', help='Skip performance tests')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-run every batch in component tests instead of reusing identical runs')
     
     args = parser.parse_args()
     
@@ -394,7 +401,14 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Initialize test runner
-    runner = IntegrationTestRunner()
+    settings = None
+    if args.no_cache:
+        try:
+            from utils.config import get_project_settings
+        except ImportError:
+            from src.utils.config import get_project_settings
+        settings = {**get_project_settings(), 'cache_batch_runs': False}
+    runner = IntegrationTestRunner(settings)
     
     # Run tests based on arguments
     if args.type == 'system':
@@ -22,25 +22,27 @@ class DataLoader:
         # Ensure directories exist
         ensure_directories()
     
-    def load_product_data(self, file_path: Optional[Path] = None, validate: bool = True) -> pd.DataFrame:
+    def load_product_data(self, file_path: Optional[Path] = None, validate: bool = True,
+                          limit: Optional[int] = None) -> pd.DataFrame:
         """
         Load and validate product data from CSV
         
         Args:
             file_path: Path to CSV file (defaults to cleaned data)
             validate: Whether to perform data validation
+            limit: Read at most this many rows (defaults to the whole file)
             
         Returns:
             DataFrame with product data
         """
         if self.product_data is not None:
-            return self.product_data
+            return self.product_data if limit is None else self.product_data.head(limit)
             
         if file_path is None:
             file_path = CLEANED_DATA_PATH
             
         try:
-            df = pd.read_csv(file_path)
+            df = pd.read_csv(file_path, nrows=limit)
             logger.info(f"Loaded {len(df)} products from {file_path}")
             
             # Validate required columns
@@ -63,7 +65,9 @@ class DataLoader:
             
             # Basic data validation and filtering
             df = self._validate_product_data(df)
-            self.product_data = df
+            # Only the full dataset is kept for later calls
+            if limit is None:
+                self.product_data = df
             
             return df
             
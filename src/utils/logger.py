@@ -3,6 +3,7 @@ Logging utilities for Smart Description Iterative Improvement System
 """
 import structlog
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from .config import LOGS_DIR, LOG_LEVEL, LOG_FORMAT
@@ -62,8 +63,9 @@ def setup_logging(log_level: str = LOG_LEVEL, log_file: Optional[str] = None):
     
     print(f"Logging configured: {log_level} level, file: {log_file}")
 
+@lru_cache(maxsize=None)
 def get_logger(name: str):
-    """Get a structured logger for the given name"""
+    """Get a structured logger for the given name, memoized per name"""
     return structlog.get_logger(name)
 
 def log_batch_processing(batch_id: str, total_items: int, successful_items: int, 
@@ -1,6 +1,7 @@
 # tests/test_ai_analysis.py
 import pytest
 import json
+import os
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 from src.ai_analysis import AIClient, PatternAnalyzer, RuleSuggester, RuleSuggestion, AnalysisAggregator
@@ -328,18 +329,65 @@ class TestAnalysisAggregator:
         assert len(insights) > 0
         assert any('Most missing feature: company' in insight for insight in insights)
         assert any('Generated 3 rule suggestions' in insight for insight in insights)
-    
+
+    def test_recommendations_generation(self):
+        """Test recommendations are bucketed by priority, type and confidence"""
+        rule_suggestions = [
+            RuleSuggestion('company', 'SMITH', 'Smith Company', 0.9, 'Test', [], priority=4),
+            RuleSuggestion('company', 'ACME', 'Acme Corp', 0.6, 'Test', [], priority=3),
+            RuleSuggestion('specification', 'C153', 'AWWA C153', 0.85, 'Test', [], priority=2),
+            RuleSuggestion('material', 'DI', 'ductile iron', 0.5, 'Test', [], priority=1)
+        ]
+
+        recommendations = self.analysis_aggregator._generate_recommendations(rule_suggestions)
+        by_type = {rec['type']: rec for rec in recommendations}
+
+        assert [rec['type'] for rec in recommendations] == [
+            'high_priority_rules', 'company_rules', 'specification_rules',
+            'material_rules', 'high_confidence_rules'
+        ]
+        assert len(by_type['high_priority_rules']['rules']) == 2
+        assert by_type['company_rules']['description'] == "Add 2 company name recognition rules"
+        assert by_type['material_rules']['priority'] == 'low'
+        assert [r['pattern'] for r in by_type['high_confidence_rules']['rules']] == ['SMITH', 'C153']
+
+    @patch('src.ai_analysis.analysis_aggregator.ORJSON_AVAILABLE', False)
     @patch('builtins.open', create=True)
     @patch('json.dump')
     def test_save_analysis(self, mock_json_dump, mock_open):
         """Test analysis saving"""
         analysis = {'test': 'data'}
         
-        self.analysis_aggregator._save_analysis(analysis)
+        with patch.object(self.analysis_aggregator, '_update_latest_index'), \
+             patch('src.ai_analysis.analysis_aggregator.os.fsync'), \
+             patch('src.ai_analysis.analysis_aggregator.os.replace'):
+            self.analysis_aggregator._save_analysis(analysis)
         
         mock_open.assert_called_once()
         mock_json_dump.assert_called_once()
 
+    def test_save_and_load_analysis_roundtrip(self, tmp_path):
+        """Test saved analysis can be loaded back"""
+        aggregator = AnalysisAggregator(self.mock_ai_client, tmp_path)
+        analysis = {'timestamp': '2024-01-01T00:00:00', 'insights': ['a', 'b'], 'metadata': {'total_suggestions': 2}}
+
+        aggregator._save_analysis(analysis)
+
+        assert aggregator.load_previous_analysis() == analysis
+        assert not list((tmp_path / "analysis").glob("*.tmp"))
+
+    def test_load_latest_analysis_without_index(self, tmp_path):
+        """Test latest analysis is found by directory scan when the index is missing"""
+        aggregator = AnalysisAggregator(self.mock_ai_client, tmp_path)
+        analysis_dir = tmp_path / "analysis"
+        (analysis_dir / "analysis_20240101_000000.json").write_text(json.dumps({'run': 'old'}))
+        newest = analysis_dir / "analysis_20240102_000000.json"
+        newest.write_text(json.dumps({'run': 'new'}))
+        os.utime(newest, (2_000_000_000, 2_000_000_000))
+
+        assert not (analysis_dir / "_latest.json").exists()
+        assert aggregator.load_previous_analysis() == {'run': 'new'}
+
 
 class TestAIAnalysisIntegration:
     """Test AI Analysis integration"""
@@ -8,12 +8,29 @@ import json
 from datetime import datetime
 
 from src.batch_processor import BatchProcessingSystem, BatchConfig
-from src.batch_processor.processor import BatchProcessor
+from src.batch_processor.processor import BatchProcessor, BatchResult
+from src.batch_processor.dynamic_scaling_controller import DynamicScalingController
 from src.batch_processor.batch_manager import BatchManager, BatchStatus
 from src.progress_tracking.metrics_collector import MetricsCollector
 from src.progress_tracking.performance_analyzer import PerformanceAnalyzer
 from src.utils.smart_description_generator import DescriptionResult
 
+class StaticDescriptionGenerator:
+    """Picklable generator for exercising process-based batch processing"""
+    
+    def generate_description(self, product_data):
+        if product_data['item_id'] == 'test_2':
+            raise Exception("Processing failed")
+        return DescriptionResult(
+            original_description=product_data['item_description'],
+            enhanced_description=f"Enhanced {product_data['item_description']}",
+            confidence_score=0.8,
+            confidence_level='High',
+            extracted_features={'product_type': 'fitting'},
+            hts_context={'hts_code': product_data['final_hts']},
+            processing_metadata={}
+        )
+
 class TestBatchProcessor:
     """Test batch processing functionality"""
     
@@ -63,6 +80,24 @@ class TestBatchProcessor:
             assert len(batch_data) == 2
             assert batch_metadata['batch_id'] == batch_id
     
+    def test_batch_metadata_lookup(self):
+        """Test metadata can be read without the batch data file and is cached"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings = {**self.mock_settings, 'batches_dir': tmpdir}
+            
+            batch_manager = BatchManager(self.mock_data_loader, settings)
+            batch_id = batch_manager.create_batch(BatchConfig(batch_size=2))
+            (Path(tmpdir) / f"{batch_id}_data.json").unlink()
+            
+            batch_metadata = batch_manager.get_batch_metadata(batch_id)
+            assert batch_metadata['batch_id'] == batch_id
+            
+            (Path(tmpdir) / f"{batch_id}_metadata.json").unlink()
+            assert batch_manager.get_batch_metadata(batch_id) is batch_metadata
+            
+            with pytest.raises(FileNotFoundError):
+                batch_manager.get_batch_metadata("missing")
+    
     def test_batch_processing(self):
         """Test batch processing"""
         processor = BatchProcessor(self.mock_description_generator)
@@ -117,6 +152,19 @@ class TestBatchProcessor:
         assert batch_result.confidence_distribution['High'] == 1
         assert batch_result.confidence_distribution['Low'] == 1
     
+    def test_parallel_batch_processing_matches_sequential(self):
+        """Test process-parallel batch processing gives the same results in order"""
+        processor = BatchProcessor(StaticDescriptionGenerator())
+        products = self.sample_products * 3
+        
+        sequential = processor.process_batch(products, BatchConfig())
+        parallel = processor.process_batch(products, BatchConfig(n_jobs=2))
+        
+        assert parallel.successful_items == sequential.successful_items == 3
+        assert parallel.failed_items == sequential.failed_items == 3
+        assert parallel.confidence_distribution == sequential.confidence_distribution
+        assert [r.item_id for r in parallel.results] == [r.item_id for r in sequential.results]
+    
     def test_batch_status_tracking(self):
         """Test batch status tracking"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -151,6 +199,45 @@ class TestBatchProcessor:
             assert retrieved_status.batch_id == batch_id
             assert retrieved_status.status == 'processing'
             assert retrieved_status.total_items == 2
+            assert retrieved_status.start_time == status.start_time
+            
+            # to_dict covers every field and round-trips through the constructor
+            status_data = status.to_dict()
+            assert status_data['start_time'] == status.start_time.isoformat()
+            assert BatchStatus(**{**status_data, 'start_time': status.start_time}) == status
+    
+    def test_batch_status_write_behind(self):
+        """Test buffered status updates are visible before and after flushing"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings = {**self.mock_settings, 'batches_dir': tmpdir, 'status_write_behind_interval': 60}
+            batch_manager = BatchManager(self.mock_data_loader, settings)
+            status_file = Path(tmpdir) / "batch_1_status.json"
+            
+            status = BatchStatus(
+                batch_id='batch_1',
+                status='processing',
+                total_items=2,
+                processed_items=0,
+                successful_items=0,
+                failed_items=0,
+                high_confidence_count=0,
+                medium_confidence_count=0,
+                low_confidence_count=0,
+                start_time=datetime.now()
+            )
+            batch_manager.update_batch_status('batch_1', status)
+            status.status = 'completed'
+            batch_manager.update_batch_status('batch_1', status)
+            
+            # Updates are coalesced in memory until flushed
+            assert not status_file.exists()
+            assert batch_manager.get_batch_status('batch_1').status == 'completed'
+            
+            batch_manager.close()
+            
+            with open(status_file) as f:
+                assert json.load(f)['status'] == 'completed'
+            assert batch_manager.get_batch_status('batch_1') == status
     
     def test_progress_tracking(self):
         """Test progress tracking functionality"""
@@ -318,3 +405,60 @@ class TestBatchIntegration:
             assert batch_result.successful_items == 0
             assert batch_result.failed_items == 3
             assert batch_result.confidence_distribution['Low'] == 3
+
+    
+    def test_recommended_batch_size_follows_latency(self):
+        """Test the EWMA batch size grows under the latency SLO and halves above it"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings = {**self.settings, 'data_dir': tmpdir, 'batches_dir': f"{tmpdir}/batches",
+                        'batch_latency_slo': 10.0}
+            batch_system = BatchProcessingSystem(
+                self.mock_data_loader,
+                self.mock_description_generator,
+                settings,
+                enable_dynamic_scaling=False
+            )
+            
+            assert batch_system.get_recommended_batch_size() is None
+            
+            # Half the SLO: target 100, EWMA halfway from 50
+            batch_system._update_batch_size_recommendation(50, 5_000_000_000)
+            assert batch_system.get_recommended_batch_size() == 75
+            
+            # Over the SLO: halve
+            batch_system._update_batch_size_recommendation(75, 20_000_000_000)
+            assert batch_system.get_recommended_batch_size() == 38
+
+
+class TestDynamicScalingController:
+    """Test dynamic scaling evaluation behaviour"""
+    
+    def _batch_result(self, batch_id, total_items=10, successful_items=10, high=8):
+        return BatchResult(
+            batch_id=batch_id,
+            total_items=total_items,
+            successful_items=successful_items,
+            failed_items=total_items - successful_items,
+            processing_time=1.0,
+            confidence_distribution={'High': high, 'Medium': total_items - high, 'Low': 0},
+            results=[]
+        )
+    
+    def test_unchanged_batches_skip_evaluation(self):
+        """Test batches matching the last no-change decision are not re-evaluated"""
+        controller = DynamicScalingController(Mock(), Mock())
+        controller.evaluation_frequency = 1
+        decision = Mock()
+        
+        def evaluate():
+            controller._last_decision = decision
+            return False
+        
+        with patch.object(controller, 'evaluate_and_apply_scaling', side_effect=evaluate) as mock_evaluate:
+            controller.process_batch_completion(self._batch_result('b1'))
+            controller.process_batch_completion(self._batch_result('b2'))
+            assert mock_evaluate.call_count == 1
+            
+            # A batch that drifts beyond the tolerance is evaluated again
+            controller.process_batch_completion(self._batch_result('b3', successful_items=7))
+            assert mock_evaluate.call_count == 2
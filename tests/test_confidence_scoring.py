@@ -1,6 +1,7 @@
 # tests/test_confidence_scoring.py
 import pytest
 import numpy as np
+from unittest.mock import patch
 from src.confidence_scoring import (
     ConfidenceScorer, 
     ConfidenceCategorizer, 
@@ -175,6 +176,14 @@ class TestConfidenceCategorizer:
         level = categorizer.categorize(0.85)
         assert level == ConfidenceLevel.MEDIUM
     
+    def test_categorize_many_matches_categorize(self):
+        """Test batch categorization agrees with per-score categorization"""
+        scores = [0.0, 0.45, 0.6, 0.65, 0.8, 0.85, 1.0]
+        
+        levels = self.categorizer.categorize_many(scores)
+        
+        assert list(levels) == [self.categorizer.categorize(s).value for s in scores]
+    
     def test_categorization_stats(self):
         """Test categorization statistics"""
         results = [
@@ -191,6 +200,23 @@ class TestConfidenceCategorizer:
         assert stats['distribution']['Low'] == 1
         assert abs(stats['avg_score'] - 0.67) < 0.1
         assert abs(stats['high_confidence_rate'] - 0.33) < 0.1
+    
+    def test_score_stats_match_categorization_stats(self):
+        """Test score-based statistics agree with result-based statistics"""
+        scores = [0.9, 0.7, 0.4, 0.8, 0.6, 0.1]
+        results = [
+            {'confidence_level': self.categorizer.categorize(s).value, 'confidence_score': s}
+            for s in scores
+        ]
+        
+        stats = self.categorizer.get_score_stats(scores)
+        expected = self.categorizer.get_categorization_stats(results)
+        
+        assert stats['distribution'] == expected['distribution']
+        assert stats['total_items'] == expected['total_items']
+        assert stats['avg_score'] == pytest.approx(expected['avg_score'])
+        assert stats['high_confidence_rate'] == pytest.approx(expected['high_confidence_rate'])
+        assert self.categorizer.get_score_stats([])['total_items'] == 0
 
 
 class TestQualityValidator:
@@ -269,6 +295,54 @@ class TestConfidenceCalibrator:
         assert len(calibrated_new) == len(new_scores)
         assert all(0.0 <= score <= 1.0 for score in calibrated_new)
     
+    def test_apply_calibration_matches_isotonic_predict(self):
+        """Test the pool-adjacent-violators fit agrees with sklearn's IsotonicRegression"""
+        isotonic = pytest.importorskip("sklearn.isotonic")
+        rng = np.random.default_rng(0)
+        confidence_scores = np.round(rng.random(200), 2)
+        actual_quality = rng.random(200) < confidence_scores
+        self.calibrator.calibrate_scores(confidence_scores.tolist(), actual_quality.tolist())
+        
+        reference = isotonic.IsotonicRegression(out_of_bounds='clip')
+        reference.fit(confidence_scores, actual_quality)
+        
+        new_scores = np.linspace(-0.5, 1.5, 101)
+        calibrated = self.calibrator.apply_calibration(new_scores.tolist())
+        
+        np.testing.assert_allclose(calibrated, reference.predict(new_scores))
+    
+    def test_apply_scalar_matches_apply_calibration(self):
+        """Test single-score calibration agrees with batch calibration"""
+        rng = np.random.default_rng(1)
+        confidence_scores = rng.random(100)
+        actual_quality = rng.random(100) < confidence_scores
+        new_scores = np.linspace(-0.5, 1.5, 201).tolist() + confidence_scores.tolist()
+        
+        assert [self.calibrator.apply_scalar(s) for s in new_scores] == new_scores
+        
+        self.calibrator.calibrate_scores(confidence_scores.tolist(), actual_quality.tolist())
+        assert [self.calibrator.apply_scalar(s) for s in new_scores] == \
+            self.calibrator.apply_calibration(new_scores)
+        
+        with patch('src.confidence_scoring.calibrator.SKLEARN_AVAILABLE', False):
+            self.calibrator.calibrate_scores(confidence_scores.tolist(), actual_quality.tolist())
+        assert [self.calibrator.apply_scalar(s) for s in new_scores] == \
+            pytest.approx(self.calibrator.apply_calibration(new_scores))
+    
+    def test_linear_calibration_fallback(self):
+        """Test linear calibration is used and clipped when sklearn is unavailable"""
+        confidence_scores = [0.9, 0.8, 0.3, 0.2]
+        actual_quality = [True, True, False, False]
+        
+        with patch('src.confidence_scoring.calibrator.SKLEARN_AVAILABLE', False):
+            calibrated_scores = self.calibrator.calibrate_scores(confidence_scores, actual_quality)
+            calibrated_new = self.calibrator.apply_calibration([0.7, 0.5, 2.0])
+        
+        assert isinstance(calibrated_scores, list)
+        assert calibrated_scores[0] == 1.0 and calibrated_scores[-1] == 0.0
+        assert isinstance(calibrated_new, list)
+        assert calibrated_new[1] < calibrated_new[0] < calibrated_new[2] == 1.0
+    
     def test_calibration_quality_metrics(self):
         """Test calibration quality metrics"""
         quality = self.calibrator.get_calibration_quality()
@@ -338,6 +412,35 @@ class TestConfidenceScoringSystem:
         assert len(batch_result['results']) == 2
         assert 'distribution' in batch_result['statistics']
     
+    def test_process_batch_matches_score_and_categorize(self):
+        """Test batched scoring gives the same results as per-item scoring"""
+        results = [
+            {
+                'original_description': '36 C153 MJ 22 TN431 ZINC',
+                'enhanced_description': '36-inch Ductile Iron Pipe Fitting with Mechanical Joint',
+                'extracted_features': {'dimensions': '36-inch', 'product_type': 'pipe fitting'},
+                'hts_context': {'hierarchical_description': 'Tube or pipe fittings'}
+            },
+            {
+                'original_description': 'test 2',
+                'enhanced_description': 'enhanced test 2',
+                'extracted_features': {},
+                'hts_context': {}
+            }
+        ]
+        self.system.calibrate_system(
+            [{'confidence_score': 0.9}, {'confidence_score': 0.5}, {'confidence_score': 0.2}],
+            [True, True, False]
+        )
+        
+        batch_result = self.system.process_batch(results)
+        
+        assert batch_result['results'] == [self.system.score_and_categorize(r) for r in results]
+        
+        stats_only = self.system.process_batch(results, return_results=False)
+        assert stats_only['results'] is None
+        assert stats_only['statistics'] == batch_result['statistics']
+    
     def test_system_calibration(self):
         """Test system calibration"""
         historical_results = [
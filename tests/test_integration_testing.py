@@ -5,6 +5,9 @@ Unit tests for the integration testing system
 Tests the integration testing components themselves to ensure they work correctly.
 """
 
+import os
+import json
+import shutil
 import pytest
 import tempfile
 from pathlib import Path
@@ -18,6 +21,7 @@ from src.integration_testing import (
     TestDataGenerator,
     TestResult
 )
+from src.integration_testing.component_tester import clear_ai_client_cache
 
 class TestTestDataGenerator:
     """Test the test data generator"""
@@ -130,6 +134,29 @@ class TestSystemIntegrationTester:
             assert tester.data_dir == Path(tmpdir)
             assert tester.test_data_dir.exists()
     
+    def test_tmpfs_test_data_dir(self):
+        """Test scratch files move to a RAM-backed directory only when requested"""
+        if not os.path.ismount('/dev/shm'):
+            pytest.skip("/dev/shm is not mounted")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10,
+                'tests_use_tmpfs': True
+            }
+            
+            tester = SystemIntegrationTester(test_settings)
+            try:
+                assert tester.test_data_dir.parent == Path('/dev/shm')
+                assert (tester.test_data_dir / "rules").is_dir()
+                assert tester.results_dir == Path(tmpdir) / "integration_tests"
+            finally:
+                shutil.rmtree(tester.test_data_dir, ignore_errors=True)
+            
+            default_tester = SystemIntegrationTester({**test_settings, 'tests_use_tmpfs': False})
+            assert default_tester.test_data_dir == default_tester.results_dir
+    
     def test_data_integration_test(self):
         """Test data integration test method"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -190,6 +217,103 @@ class TestSystemIntegrationTester:
                 assert isinstance(result, TestResult)
                 assert result.test_name == "batch_processing_flow"
                 assert result.status in ["passed", "failed"]
+    
+    def test_run_full_system_test_in_parallel(self):
+        """Test the full system run reports every test in declared order when run concurrently"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            tester = SystemIntegrationTester(test_settings)
+            test_names = list(tester._TEST_METHODS)
+            for name in test_names:
+                setattr(tester, name, Mock(return_value=TestResult(test_name=name, status="passed", duration=0, details={})))
+            tester._test_dynamic_scaling.return_value = TestResult(
+                test_name="_test_dynamic_scaling", status="failed", duration=0, details={},
+                error_message="Dynamic scaling test failed: boom"
+            )
+            
+            summary = tester.run_full_system_test()
+            
+            assert list(summary['results']) == test_names
+            assert sorted(name for lane in tester._TEST_LANES for name in lane) == sorted(test_names)
+            assert summary['passed'] == len(test_names) - 1
+            assert summary['failed'] == 1
+            assert "boom" in summary['results']['_test_dynamic_scaling'].error_message
+            assert [r.test_name for r in tester.test_results] == test_names
+    
+    def test_integration_test_wrapper_outcomes(self):
+        """Test wrapped system tests report skips and escaped exceptions as results"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            tester = SystemIntegrationTester(test_settings)
+            
+            tester.__dict__['product_data'] = None
+            skipped = tester._test_data_integration()
+            assert skipped.test_name == "data_integration"
+            assert skipped.status == "skipped"
+            assert skipped.warnings == ["Test data not found, skipping data integration test"]
+            
+            tester.test_gen.create_mock_processing_results = Mock(side_effect=RuntimeError("boom"))
+            failed = tester._test_confidence_scoring_flow()
+            assert failed.test_name == "confidence_scoring_flow"
+            assert failed.status == "failed"
+            assert failed.error_message == "Confidence scoring test failed: boom"
+            assert failed.duration >= 0
+    
+    def test_run_full_system_test_persistence(self):
+        """Test the run summary is saved as JSON unless persistence is skipped"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            tester = SystemIntegrationTester(test_settings)
+            for name in tester._TEST_METHODS:
+                setattr(tester, name, Mock(return_value=TestResult(test_name=name, status="passed", duration=0, details={})))
+            
+            tester.run_full_system_test(save_results=False)
+            assert not list(tester.results_dir.glob("integration_test_results_*.json"))
+            
+            tester.run_full_system_test()
+            saved = list(tester.results_dir.glob("integration_test_results_*.json"))
+            assert len(saved) == 1
+            with open(saved[0]) as f:
+                summary = json.load(f)
+            assert summary['results']['_test_data_integration']['status'] == "passed"
+            assert b"\n" not in saved[0].read_bytes().strip()
+            
+            shutil.rmtree(tester.results_dir)
+            tester.results_dir.mkdir()
+            test_settings['integration_test_pretty_results'] = True
+            tester.run_full_system_test()
+            saved = list(tester.results_dir.glob("integration_test_results_*.json"))
+            assert b'\n  "results"' in saved[0].read_bytes()
+    
+    def test_result_status_enum(self):
+        """Test that string statuses are normalized and still compare as strings"""
+        from src.integration_testing import TestStatus
+        
+        result = TestResult(test_name="status_check", status="passed", duration=0, details={})
+        
+        assert result.status is TestStatus.PASSED
+        assert result.status == "passed"
+        assert result.status != "failed"
+        assert str(result.status) == "passed"
+        assert result.to_dict() == {
+            'test_name': "status_check", 'status': "passed", 'duration': 0,
+            'details': {}, 'error_message': None, 'warnings': []
+        }
+        assert TestResult("t", TestStatus.SKIPPED, 0, {}).status == "skipped"
+        with pytest.raises(ValueError):
+            TestResult(test_name="status_check", status="unknown", duration=0, details={})
 
 
 class TestComponentInteractionTester:
@@ -209,6 +333,7 @@ class TestComponentInteractionTester:
             assert tester is not None
             assert tester.settings == test_settings
             assert tester.test_data_dir.exists()
+            assert (tester.test_data_dir / "versioning_rules_test").is_dir()
     
     def test_batch_to_ai_analysis_flow(self):
         """Test batch to AI analysis flow test method"""
@@ -256,6 +381,159 @@ class TestComponentInteractionTester:
                 assert isinstance(result, TestResult)
                 assert result.test_name == "batch_to_ai_analysis_flow"
                 assert result.status in ["passed", "failed"]
+    
+    def test_shared_components_built_once(self):
+        """Test flow tests reuse the tester's shared component wiring"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batches_dir': f"{tmpdir}/batches",
+                'batch_size': 10
+            }
+            
+            tester = ComponentInteractionTester(test_settings)
+            clear_ai_client_cache()
+            
+            with patch('src.integration_testing.component_tester.AIClient', side_effect=ValueError), \
+                 patch.object(tester.test_data_generator, 'create_mock_ai_client',
+                              wraps=tester.test_data_generator.create_mock_ai_client) as mock_create_client:
+                tester.test_batch_to_ai_analysis_flow()
+                tester.test_ai_to_rule_management_flow()
+                
+                assert mock_create_client.call_count == 1
+                
+                clear_ai_client_cache()
+                tester.test_ai_to_rule_management_flow()
+                assert mock_create_client.call_count == 2
+                assert tester.batch_system is tester.batch_system
+                assert tester.batch_system.batch_processor.generator is tester.mock_description_generator
+
+    
+    def test_batch_runs_memoized(self):
+        """Test identical batch runs are reused unless caching is disabled"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            batch_system = Mock()
+            
+            tester = ComponentInteractionTester(test_settings)
+            first = tester._run_batch_cached(batch_system, 3)
+            assert tester._run_batch_cached(batch_system, 3) is first
+            tester._run_batch_cached(batch_system, 2)
+            assert batch_system.run_batch.call_count == 2
+            
+            uncached_tester = ComponentInteractionTester({**test_settings, 'cache_batch_runs': False})
+            uncached_tester._run_batch_cached(batch_system, 3)
+            uncached_tester._run_batch_cached(batch_system, 3)
+            assert batch_system.run_batch.call_count == 4
+
+    
+    def test_run_component_interaction_tests_in_parallel(self):
+        """Test parallel flow execution keeps declared order and captures exceptions"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            tester = ComponentInteractionTester(test_settings)
+            flow_names = [
+                'test_batch_to_ai_analysis_flow',
+                'test_ai_to_rule_management_flow',
+                'test_rule_to_batch_processing_flow',
+                'test_confidence_to_feedback_flow',
+                'test_metrics_to_quality_monitoring_flow',
+                'test_versioning_to_rule_management_flow',
+                'test_notes_to_analysis_flow',
+                'test_feedback_to_scaling_flow'
+            ]
+            for name in flow_names:
+                flow = Mock(return_value=TestResult(test_name=name, status="passed", duration=0, details={}))
+                flow.__name__ = name
+                setattr(tester, name, flow)
+            tester.test_notes_to_analysis_flow.side_effect = RuntimeError("boom")
+            
+            results = tester.run_component_interaction_tests()
+            
+            assert list(results) == flow_names
+            assert sorted(name for lane in tester._FLOW_LANES for name in lane) == sorted(flow_names)
+            assert results['test_notes_to_analysis_flow'].status == "failed"
+            assert "boom" in results['test_notes_to_analysis_flow'].error_message
+            assert all(results[name].status == "passed" for name in flow_names if name != 'test_notes_to_analysis_flow')
+
+    
+    def test_suggest_rules_disk_cache(self):
+        """Test rule suggestions are reused from disk only when the cache is enabled"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            tester = ComponentInteractionTester(test_settings)
+            rule_suggester = Mock()
+            rule_suggester.suggest_rules.return_value = [{'rule_type': 'material', 'pattern': 'DI'}]
+            analysis = {'patterns': ['Missing material specifications']}
+            
+            with patch.dict('os.environ', {'ATHENA_INTEGRATION_CACHE': '1'}):
+                first = tester._suggest_rules_cached(rule_suggester, analysis)
+                second = tester._suggest_rules_cached(rule_suggester, analysis)
+            assert first == second == rule_suggester.suggest_rules.return_value
+            assert rule_suggester.suggest_rules.call_count == 1
+            
+            with patch.dict('os.environ', {'ATHENA_INTEGRATION_CACHE': '0'}):
+                tester._suggest_rules_cached(rule_suggester, analysis)
+            assert rule_suggester.suggest_rules.call_count == 2
+    
+    def test_ai_to_rule_flow_approves_rules_concurrently(self):
+        """Test valid suggestions are each approved into their own rules directory"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            tester = ComponentInteractionTester(test_settings)
+            suggestions = [
+                {'rule_type': 'material', 'pattern': r'\bSS\b', 'replacement': 'stainless steel'},
+                {'rule_type': 'format', 'pattern': r'\s+', 'replacement': ' '},
+                {'rule_type': 'broken', 'pattern': '(', 'replacement': 'x'}
+            ]
+            
+            with patch.object(tester, '_suggest_rules_cached', return_value=suggestions):
+                result = tester.test_ai_to_rule_management_flow()
+            
+            assert result.status == "passed"
+            assert result.details['rules_approved'] == 2
+            rules_dir = tester.test_data_dir / "ai_to_rule_test"
+            assert (rules_dir / "test_rule_0_material" / "current_rules.json").exists()
+            assert (rules_dir / "test_rule_1_format" / "current_rules.json").exists()
+            assert not (rules_dir / "test_rule_2_broken").exists()
+    
+    def test_notes_flow_reuses_saved_notes(self):
+        """Test the notes flow only seeds and saves notes when none are on disk yet"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_settings = {
+                'data_dir': tmpdir,
+                'input_dir': f"{tmpdir}/input",
+                'batch_size': 10
+            }
+            tester = ComponentInteractionTester(test_settings)
+            
+            from src.ai_analysis import NotesManager
+            with patch.object(NotesManager, '_save_notes', autospec=True,
+                              side_effect=NotesManager._save_notes) as save_notes:
+                first = tester.test_notes_to_analysis_flow()
+                second = tester.test_notes_to_analysis_flow()
+            
+            assert first.status == "passed"
+            assert second.status == "passed"
+            assert second.details['total_notes'] == first.details['total_notes']
+            assert save_notes.call_count == 1
 
 
 class TestPerformanceIntegrationTester:
@@ -106,6 +106,22 @@ class TestProjectSetup:
         except Exception as e:
             pytest.fail(f"Sample data retrieval failed: {e}")
 
+    def test_product_data_limit(self, tmp_path):
+        """Test that a row limit bounds the read and is not cached as the full dataset"""
+        csv_path = tmp_path / "products.csv"
+        rows = ["item_id,item_description,final_hts,material_class,material_detail"]
+        rows += [f"item_{i},Steel bolt {i},7318.15.20.00,steel,carbon" for i in range(10)]
+        csv_path.write_text("\n".join(rows) + "\n")
+        
+        loader = DataLoader()
+        limited = loader.load_product_data(csv_path, validate=False, limit=3)
+        assert len(limited) == 3
+        assert loader.product_data is None
+        
+        full = loader.load_product_data(csv_path, validate=False)
+        assert len(full) == 10
+        assert len(loader.load_product_data(limit=4)) == 4
+
 def test_imports():
     """Test that all modules can be imported"""
     try: